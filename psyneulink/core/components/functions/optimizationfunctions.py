@@ -31,7 +31,9 @@ Functions that return the sample of a variable yielding the optimized value of a
 import warnings
 import sys
 # from fractions import Fraction
+import functools
 import itertools
+import operator
 import numpy as np
 import typecheck as tc
 from numbers import Number
@@ -61,6 +63,9 @@ SEARCH_FUNCTION = 'search_function'
 SEARCH_SPACE = 'search_space'
 SEARCH_TERMINATION_FUNCTION = 'search_termination_function'
 DIRECTION = 'direction'
+SAVE_SAMPLES = 'save_samples'
+SAVE_VALUES = 'save_values'
+MAX_ITERATIONS = 'max_iterations'
 
 class OptimizationFunctionError(Exception):
     def __init__(self, error_value):
@@ -342,17 +347,16 @@ class OptimizationFunction(Function_Base):
         saved_samples = Parameter([], read_only=True, pnl_internal=True)
         saved_values = Parameter([], read_only=True, pnl_internal=True)
 
-    @tc.typecheck
     def __init__(
         self,
         default_variable=None,
-        objective_function:tc.optional(is_function_type)=None,
-        search_function:tc.optional(is_function_type)=None,
+        objective_function=None,
+        search_function=None,
         search_space=None,
-        search_termination_function:tc.optional(is_function_type)=None,
-        save_samples:tc.optional(bool)=None,
-        save_values:tc.optional(bool)=None,
-        max_iterations:tc.optional(int)=None,
+        search_termination_function=None,
+        save_samples=None,
+        save_values=None,
+        max_iterations=None,
         params=None,
         owner=None,
         prefs=None,
@@ -395,13 +399,15 @@ class OptimizationFunction(Function_Base):
             if not is_function_type(request_set[OBJECTIVE_FUNCTION]):
                 raise OptimizationFunctionError("Specification of {} arg for {} ({}) must be a function or method".
                                                 format(repr(OBJECTIVE_FUNCTION), self.__class__.__name__,
-                                                       request_set[OBJECTIVE_FUNCTION].__name__))
+                                                       getattr(request_set[OBJECTIVE_FUNCTION], '__name__',
+                                                               request_set[OBJECTIVE_FUNCTION])))
 
         if SEARCH_FUNCTION in request_set and request_set[SEARCH_FUNCTION] is not None:
             if not is_function_type(request_set[SEARCH_FUNCTION]):
                 raise OptimizationFunctionError("Specification of {} arg for {} ({}) must be a function or method".
                                                 format(repr(SEARCH_FUNCTION), self.__class__.__name__,
-                                                       request_set[SEARCH_FUNCTION].__name__))
+                                                       getattr(request_set[SEARCH_FUNCTION], '__name__',
+                                                               request_set[SEARCH_FUNCTION])))
 
         if SEARCH_SPACE in request_set and request_set[SEARCH_SPACE] is not None:
             search_space = request_set[SEARCH_SPACE]
@@ -415,7 +421,8 @@ class OptimizationFunction(Function_Base):
             if not is_function_type(request_set[SEARCH_TERMINATION_FUNCTION]):
                 raise OptimizationFunctionError("Specification of {} arg for {} ({}) must be a function or method".
                                                 format(repr(SEARCH_TERMINATION_FUNCTION), self.__class__.__name__,
-                                                       request_set[SEARCH_TERMINATION_FUNCTION].__name__))
+                                                       getattr(request_set[SEARCH_TERMINATION_FUNCTION], '__name__',
+                                                               request_set[SEARCH_TERMINATION_FUNCTION])))
 
             try:
                 b = request_set[SEARCH_TERMINATION_FUNCTION]()
@@ -430,6 +437,19 @@ class OptimizationFunction(Function_Base):
                 if 'required positional arguments' not in str(e):
                     raise
 
+        for param_name in (SAVE_SAMPLES, SAVE_VALUES):
+            if param_name in request_set and request_set[param_name] is not None:
+                if not isinstance(request_set[param_name], (bool, np.bool_)):
+                    raise OptimizationFunctionError("Specification of {} arg for {} ({}) must be a bool".
+                                                    format(repr(param_name), self.__class__.__name__,
+                                                           request_set[param_name]))
+
+        if MAX_ITERATIONS in request_set and request_set[MAX_ITERATIONS] is not None:
+            if not isinstance(request_set[MAX_ITERATIONS], (int, np.integer)):
+                raise OptimizationFunctionError("Specification of {} arg for {} ({}) must be an int".
+                                                format(repr(MAX_ITERATIONS), self.__class__.__name__,
+                                                       request_set[MAX_ITERATIONS]))
+
     @handle_external_context(execution_id=NotImplemented)
     def reset(self, *args, context=None):
         """Reset parameters of the OptimizationFunction
@@ -489,12 +509,7 @@ class OptimizationFunction(Function_Base):
             for all the samples in the order they were evaluated; otherwise it is empty.
         """
 
-        if self._unspecified_args and self.initialization_status == ContextFlags.INITIALIZED:
-            warnings.warn("The following arg(s) were not specified for {}: {} -- using default(s)".
-                          format(self.name, ', '.join(self._unspecified_args)))
-            self._unspecified_args = []
-
-        current_sample = self._check_args(variable=variable, context=context, params=params)
+        current_sample = self._begin_optimization(variable=variable, context=context, params=params)
         current_value = self.owner.objective_mechanism.parameters.value._get(context) if self.owner else 0.
 
         samples = []
@@ -502,11 +517,18 @@ class OptimizationFunction(Function_Base):
 
         # Initialize variables used in while loop
         iteration = 0
+        # Resolve functions and parameters once, rather than on every iteration
+        search_termination_function = self.search_termination_function
+        search_function = self.search_function
+        objective_function = self.objective_function
+        max_iterations = self.parameters.max_iterations._get(context)
+        saved_samples = samples if self.parameters.save_samples._get(context) else None
+        saved_values = values if self.parameters.save_values._get(context) else None
 
         # Set up progress bar
-        _show_progress = False
+        #    (if it is not shown, _progress_bar_next_iteration is never reached, so the loop needs no separate check)
+        _progress_bar_next_iteration = -1
         if hasattr(self, OWNER) and self.owner and self.owner.prefs.reportOutputPref:
-            _show_progress = True
             _progress_bar_char = '.'
             _progress_bar_rate_str = ""
             _search_space_size = len(self.search_space)
@@ -515,42 +537,71 @@ class OptimizationFunction(Function_Base):
                 _progress_bar_rate_str = str(_progress_bar_rate) + " "
             print("\n{} executing optimization process (one {} for each {}of {} samples): ".
                   format(self.owner.name, repr(_progress_bar_char), _progress_bar_rate_str, _search_space_size))
-            _progress_bar_count = 0
+            # Print progress bar char every _progress_bar_rate iterations, starting with the first
+            _progress_bar_rate = max(_progress_bar_rate, 1)
+            _progress_bar_next_iteration = 0
         # Iterate optimization process
-        while not call_with_pruned_args(self.search_termination_function,
+        while not call_with_pruned_args(search_termination_function,
                                         current_sample,
                                         current_value, iteration,
                                         context=context):
 
-            if _show_progress:
-                increment_progress_bar = (_progress_bar_rate < 1) or not (_progress_bar_count % _progress_bar_rate)
-                if increment_progress_bar:
-                    print(_progress_bar_char, end='', flush=True)
-                _progress_bar_count +=1
+            if iteration == _progress_bar_next_iteration:
+                print(_progress_bar_char, end='', flush=True)
+                _progress_bar_next_iteration += _progress_bar_rate
 
             # Get next sample of sample
-            new_sample = call_with_pruned_args(self.search_function, current_sample, iteration, context=context)
-            # Compute new value based on new sample
-            new_value = call_with_pruned_args(self.objective_function, new_sample, context=context)
-            self._report_value(new_value)
+            new_sample = call_with_pruned_args(search_function, current_sample, iteration, context=context)
             iteration += 1
-            max_iterations = self.parameters.max_iterations._get(context)
-            if max_iterations and iteration > max_iterations:
-                warnings.warn("{} failed to converge after {} iterations".format(self.name, max_iterations))
+            # Compute new value based on new sample
+            new_value, completed = self._evaluate_sample(objective_function, new_sample, iteration, max_iterations,
+                                                         saved_samples, saved_values, context)
+            if not completed:
                 break
 
             current_sample = new_sample
             current_value = new_value
 
-            if self.parameters.save_samples._get(context):
-                samples.append(new_sample)
-                self.parameters.saved_samples._set(samples, context)
-            if self.parameters.save_values._get(context):
-                values.append(current_value)
-                self.parameters.saved_values._set(values, context)
+        self._end_optimization(samples, values, context)
 
         return new_sample, new_value, samples, values
 
+    def _begin_optimization(self, variable, context=None, params=None):
+        """Warn about unspecified args and check the args of the `optimization process
+        <OptimizationFunction_Procedure>`;  return the initial sample.
+        """
+        if self._unspecified_args and self.initialization_status == ContextFlags.INITIALIZED:
+            warnings.warn("The following arg(s) were not specified for {}: {} -- using default(s)".
+                          format(self.name, ', '.join(self._unspecified_args)))
+            self._unspecified_args = []
+
+        return self._check_args(variable=variable, context=context, params=params)
+
+    def _evaluate_sample(self, objective_function, sample, iteration, max_iterations, samples, values, context):
+        """Evaluate **sample** in iteration **iteration** of the `optimization process
+        <OptimizationFunction_Procedure>`.  Append **sample** and its value to **samples** and **values** (unless they
+        are None), and return the value and True;  if **iteration** exceeds **max_iterations**, warn and return the
+        value and False instead.
+        """
+        value = call_with_pruned_args(objective_function, sample, context=context)
+        self._report_value(value)
+        if max_iterations and iteration > max_iterations:
+            warnings.warn("{} failed to converge after {} iterations".format(self.name, max_iterations))
+            return value, False
+
+        if samples is not None:
+            samples.append(sample)
+        if values is not None:
+            values.append(value)
+        return value, True
+
+    def _end_optimization(self, samples, values, context):
+        """Assign saved samples and values once, rather than re-assigning the same lists on every iteration"""
+        if samples:
+            self.parameters.saved_samples._set(samples, context)
+        if values:
+            self.parameters.saved_values._set(values, context)
+
     def _report_value(self, new_value):
         """Report value returned by `objective_function <OptimizationFunction.objective_function>` for sample."""
         pass
@@ -1030,7 +1081,8 @@ class GradientOptimization(OptimizationFunction):
                                                                                   context=context,
                                                                                   params=params,
                                                                                   )
-        return_all_samples = return_all_values = []
+        return_all_samples = []
+        return_all_values = []
         if self.parameters.save_samples._get(context):
             return_all_samples = all_samples
         if self.parameters.save_values._get(context):
@@ -1093,6 +1145,18 @@ class GradientOptimization(OptimizationFunction):
 MAXIMIZE = 'maximize'
 MINIMIZE = 'minimize'
 
+# Number of samples decoded at once when GridSearch streams its grid
+GRID_BLOCK_SIZE = 4096
+
+
+def _validate_optimization_direction(function, request_set):
+    """Check that direction, if it is in request_set, is *MAXIMIZE* or *MINIMIZE*"""
+    if DIRECTION in request_set and request_set[DIRECTION] is not None:
+        if request_set[DIRECTION] not in {MAXIMIZE, MINIMIZE}:
+            raise OptimizationFunctionError("Specification of {} arg for {} ({}) must be {} or {}".
+                                            format(repr(DIRECTION), function.__class__.__name__,
+                                                   request_set[DIRECTION], repr(MAXIMIZE), repr(MINIMIZE)))
+
 
 class GridSearch(OptimizationFunction):
     """
@@ -1178,9 +1242,6 @@ class GridSearch(OptimizationFunction):
         contains `SampleIterators <SampleIterator>` for generating samples evaluated by `objective_function
         <GridSearch.objective_function>` in iterations of the `optimization process <GridSearch_Procedure>`;
 
-    grid : iterator
-        generates samples from the Cartesian product of `SampleIterators in `search_space <GridSearch.search_sapce>`.
-
     direction : MAXIMIZE or MINIMIZE : default MAXIMIZE
         determines the direction of optimization:  if *MAXIMIZE*, the greatest value of `objective_function
         <GridSearch.objective_function>` is sought;  if *MINIMIZE*, the least value is sought.
@@ -1220,12 +1281,6 @@ class GridSearch(OptimizationFunction):
                     :default value: `MAXIMIZE`
                     :type: ``str``
 
-                grid
-                    see `grid <GridSearch.grid>`
-
-                    :default value: None
-                    :type:
-
                 random_state
                     see `random_state <GridSearch.random_state>`
 
@@ -1244,7 +1299,6 @@ class GridSearch(OptimizationFunction):
                     :default value: True
                     :type: ``bool``
         """
-        grid = Parameter(None)
         save_samples = Parameter(True, pnl_internal=True)
         save_values = Parameter(True, pnl_internal=True)
         random_state = Parameter(None, stateful=True, loggable=False)
@@ -1254,13 +1308,12 @@ class GridSearch(OptimizationFunction):
 
     # TODO: should save_values be in the constructor if it's ignored?
     # is False or True the correct value?
-    @tc.typecheck
     def __init__(self,
                  default_variable=None,
-                 objective_function:tc.optional(is_function_type)=None,
+                 objective_function=None,
                  search_space=None,
-                 direction:tc.optional(tc.enum(MAXIMIZE, MINIMIZE))=None,
-                 save_values:tc.optional(bool)=None,
+                 direction=None,
+                 save_values=None,
                  # tolerance=0.,
                  select_randomly_from_optimal_values=None,
                  seed=None,
@@ -1278,7 +1331,8 @@ class GridSearch(OptimizationFunction):
         except TypeError:
             pass
 
-        self.num_iterations = 1 if search_space is None else np.product([i.num for i in search_space])
+        self.num_iterations = 1 if search_space is None else functools.reduce(operator.mul,
+                                                                              (i.num for i in search_space), 1)
         # self.tolerance = tolerance
 
         if seed is None:
@@ -1304,6 +1358,7 @@ class GridSearch(OptimizationFunction):
     def _validate_params(self, request_set, target_set=None, context=None):
 
         super()._validate_params(request_set=request_set, target_set=target_set, context=context)
+        _validate_optimization_direction(self, request_set)
         if SEARCH_SPACE in request_set and request_set[SEARCH_SPACE] is not None:
             search_space = request_set[SEARCH_SPACE]
 
@@ -1341,13 +1396,51 @@ class GridSearch(OptimizationFunction):
                 raise OptimizationFunctionError(f"Invalid {repr(SEARCH_SPACE)} arg for {self.name}{owner_str}; each "
                                                 f"{SampleIterator.__name__} must have a value for its 'num' attribute.")
 
-        self.num_iterations = np.product([i.num for i in sample_iterators])
+        self.num_iterations = functools.reduce(operator.mul, (i.num for i in sample_iterators), 1)
 
     def reset_grid(self):
         """Reset iterators in `search_space <GridSearch.search_space>"""
         for s in self.search_space:
             s.reset()
-        self.grid = itertools.product(*[s for s in self.search_space])
+        # Store only the values along each dimension;  samples are generated from their flat index in the grid
+        #    (in the same order as itertools.product), so that the full grid is never materialized and any sample
+        #    (e.g., the start of an MPI process' chunk) can be accessed directly
+        self._grid_axes = [tuple(s) for s in self.search_space]
+        self._grid_shape = tuple(len(axis) for axis in self._grid_axes)
+        self._grid_size = functools.reduce(operator.mul, self._grid_shape, 1)
+        strides = []
+        stride = 1
+        for size in reversed(self._grid_shape):
+            strides.append(stride)
+            stride *= size
+        self._grid_strides = tuple(reversed(strides))
+        # The same values as 1d object arrays, so that a block of samples can be gathered along each dimension at
+        #    once (see _samples_in) while each sample still contains the values themselves (as in _sample_at)
+        self._grid_axis_arrays = []
+        for axis in self._grid_axes:
+            axis_array = np.empty(len(axis), dtype=object)
+            for i, value in enumerate(axis):
+                axis_array[i] = value
+            self._grid_axis_arrays.append(axis_array)
+
+    def _sample_at(self, index):
+        """Return the sample at position **index** of the grid (last dimension varies fastest)"""
+        return tuple(axis[(index // stride) % size]
+                     for axis, stride, size in zip(self._grid_axes, self._grid_strides, self._grid_shape))
+
+    def _samples_in(self, start, stop):
+        """Return the samples at positions **start** through **stop** - 1 of the grid, as a list of tuples
+        (the same as those returned by `_sample_at <GridSearch._sample_at>`).
+        """
+        if not self._grid_axes:
+            return [self._sample_at(i) for i in range(start, stop)]
+        # A one-dimensional grid is just its axis, so the block is a slice of it
+        if len(self._grid_axes) == 1:
+            return list(zip(self._grid_axes[0][start:stop]))
+        # Decode flat indices into the index along each dimension in one (C-implemented) call,
+        #    and gather the values for the whole block along each dimension with a single indexing operation
+        indices = np.unravel_index(np.arange(start, stop), self._grid_shape)
+        return list(zip(*(axis[axis_indices] for axis, axis_indices in zip(self._grid_axis_arrays, indices))))
 
     def _get_optimized_composition(self):
         # self.objective_function may be a bound method of
@@ -1611,7 +1704,8 @@ class GridSearch(OptimizationFunction):
         """
 
         self.reset_grid()
-        return_all_samples = return_all_values = []
+        return_all_samples = []
+        return_all_values = []
 
         direction = self.parameters.direction._get(context)
         if MPI_IMPLEMENTATION:
@@ -1622,76 +1716,67 @@ class GridSearch(OptimizationFunction):
             rank = Comm.Get_rank()
             size = Comm.Get_size()
 
-            self.search_space = np.atleast_2d(self.search_space)
+            num_samples = self._grid_size
 
-            chunk_size = (len(self.search_space) + (size - 1)) // size
-            start = chunk_size * rank
-            stop = chunk_size * (rank + 1)
-            if start > len(self.search_space):
-                start = len(self.search_space)
-            if stop > len(self.search_space):
-                stop = len(self.search_space)
+            chunk_size = (num_samples + (size - 1)) // size
+            start = min(chunk_size * rank, num_samples)
+            stop = min(chunk_size * (rank + 1), num_samples)
 
-            # FIX:  INITIALIZE TO FULL LENGTH AND ASSIGN DEFAULT VALUES (MORE EFFICIENT):
-            samples = np.array([[]])
-            sample_optimal = np.empty_like(self.search_space[0])
-            values = np.array([])
+            # Preallocate contiguous (num_samples x num_dimensions) and (num_samples,) buffers for this process' chunk,
+            #    and assign to them by index, rather than growing them with np.append on every sample
+            save_samples = self.save_samples
+            save_values = self.save_values
+            samples = np.empty((stop - start if save_samples else 0, len(self._grid_shape)))
+            sample_optimal = np.empty(len(self._grid_shape))
+            values = np.empty(stop - start if save_values else 0)
             value_optimal = float('-Infinity')
-            sample_value_max_tuple = (sample_optimal, value_optimal)
+
+            assert direction == MAXIMIZE or direction == MINIMIZE, \
+                "PROGRAM ERROR: bad value for {} arg of {}: {}".format(repr(DIRECTION), self.name, direction)
+            maximize = direction == MAXIMIZE
 
             # Set up progress bar
-            _show_progress = False
+            #    (if it is not shown, _progress_bar_next_sample is never reached, so the loop needs no separate check)
+            _progress_bar_next_sample = -1
             if hasattr(self, OWNER) and self.owner and self.owner.prefs.reportOutputPref:
-                _show_progress = True
                 _progress_bar_char = '.'
                 _progress_bar_rate_str = ""
-                _search_space_size = len(self.search_space)
+                _search_space_size = num_samples
                 _progress_bar_rate = int(10**(np.log10(_search_space_size) - 2))
                 if _progress_bar_rate > 1:
                     _progress_bar_rate_str = str(_progress_bar_rate) + " "
                 print("\n{} executing optimization process (one {} for each {}of {} samples): ".
                       format(self.owner.name, repr(_progress_bar_char), _progress_bar_rate_str, _search_space_size))
-                _progress_bar_count = 0
+                # Print progress bar char every _progress_bar_rate samples, starting with the first in this chunk
+                _progress_bar_rate = max(_progress_bar_rate, 1)
+                _progress_bar_next_sample = start
 
-            for sample in self.search_space[start:stop,:]:
+            for i in range(start, stop):
+                sample = self._sample_at(i)
 
-                if _show_progress:
-                    increment_progress_bar = (_progress_bar_rate < 1) or not (_progress_bar_count % _progress_bar_rate)
-                    if increment_progress_bar:
-                        print(_progress_bar_char, end='', flush=True)
-                    _progress_bar_count +=1
+                if i == _progress_bar_next_sample:
+                    print(_progress_bar_char, end='', flush=True)
+                    _progress_bar_next_sample += _progress_bar_rate
 
                 # Evaluate objective_function for current sample
                 value = self.objective_function(sample, context=context)
 
-                # Evaluate for optimal value
-                if direction == MAXIMIZE:
-                    value_optimal = max(value, value_optimal)
-                elif direction == MINIMIZE:
-                    value_optimal = min(value, value_optimal)
-                else:
-                    assert False, "PROGRAM ERROR: bad value for {} arg of {}: {}".\
-                        format(repr(DIRECTION),self.name,direction)
-
                 # FIX: PUT ERROR HERE IF value AND/OR value_max ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
-                # If value is optimal, store corresponing sample
-                if value == value_optimal:
-                    # Keep track of port values and allocation policy associated with EVC max
+                # If value is optimal, store it along with corresponding sample
+                #    (the optimal pair is only needed after the loop, for the allgather below)
+                if (value >= value_optimal) if maximize else (value <= value_optimal):
+                    value_optimal = value
                     sample_optimal = sample
-                    sample_value_max_tuple = (sample_optimal, value_optimal)
 
                 # Save samples and/or values if specified
-                if self.save_values:
-                    # FIX:  ASSIGN BY INDEX (MORE EFFICIENT)
-                    values = np.append(values, np.atleast_1d(value), axis=0)
-                if self.save_samples:
-                    if len(samples[0])==0:
-                        samples = np.atleast_2d(sample)
-                    else:
-                        samples = np.append(samples, np.atleast_2d(sample), axis=0)
+                if save_values:
+                    values[i - start] = value
+                if save_samples:
+                    samples[i - start] = sample
 
             # Aggregate, reduce and assign global results
             # combine max result tuples from all processes and distribute to all processes
+            sample_value_max_tuple = (sample_optimal, value_optimal)
             max_tuples = Comm.allgather(sample_value_max_tuple)
             # get tuple with "value_max of maxes"
             max_value_of_max_tuples = max(max_tuples, key=lambda max_tuple: max_tuple[1])
@@ -1717,14 +1802,27 @@ class GridSearch(OptimizationFunction):
                     value_optimal = opt_value
                     sample_optimal = opt_sample
             else:
-                last_sample, last_value, all_samples, all_values = super()._function(
-                    variable=variable,
-                    context=context,
-                    params=params,
-                )
+                if self._can_stream_grid():
+                    # Evaluate the grid a block of samples at a time, and select the optimum below as they are
+                    #    evaluated;  samples and values are only accumulated if they are to be saved
+                    all_samples = []
+                    all_values = []
+                    value_sample_pairs = self._stream_grid(
+                        variable,
+                        context,
+                        params,
+                        samples=all_samples if self.parameters.save_samples._get(context) else None,
+                        values=all_values if self.parameters.save_values._get(context) else None,
+                    )
+                else:
+                    last_sample, last_value, all_samples, all_values = super()._function(
+                        variable=variable,
+                        context=context,
+                        params=params,
+                    )
+                    value_sample_pairs = zip(all_values, all_samples)
 
                 optimal_value_count = 1
-                value_sample_pairs = zip(all_values, all_samples)
                 value_optimal, sample_optimal = next(value_sample_pairs)
 
                 select_randomly = self.parameters.select_randomly_from_optimal_values._get(context)
@@ -1753,30 +1851,65 @@ class GridSearch(OptimizationFunction):
 
         return sample_optimal, value_optimal, return_all_samples, return_all_values
 
+    def _can_stream_grid(self):
+        """Return True if `_stream_grid <GridSearch._stream_grid>` can be used in place of the `optimization process
+        <OptimizationFunction_Procedure>`:  not during initialization or when its progress is reported, and only if
+        `search_function <GridSearch.search_function>` and `search_termination_function
+        <GridSearch.search_termination_function>` are those of GridSearch (i.e., have not been replaced using `reset
+        <OptimizationFunction.reset>`).
+        """
+        return (not self.is_initializing
+                and not (self.owner and self.owner.prefs.reportOutputPref)
+                and self.search_function == self._traverse_grid
+                and self.search_termination_function == self._grid_complete)
+
+    def _stream_grid(self, variable, context=None, params=None, samples=None, values=None):
+        """Generate (value, sample) pairs for the grid in order.
+        Used by `function <GridSearch.function>` in place of the `optimization process
+        <OptimizationFunction_Procedure>` (see `_can_stream_grid <GridSearch._can_stream_grid>`), which it follows,
+        but with samples taken directly from the grid a block at a time:  the number of samples evaluated is limited by
+        `max_iterations <GridSearch.max_iterations>`, and if **samples** and/or **values** are lists, the samples
+        and/or values evaluated are appended to them and assigned to `saved_samples <GridSearch.saved_samples>` and
+        `saved_values <GridSearch.saved_values>` once the grid is complete.
+        """
+        self._begin_optimization(variable=variable, context=context, params=params)
+
+        objective_function = self.objective_function
+        max_iterations = self.parameters.max_iterations._get(context)
+
+        # Decode samples a block at a time, so that only one block of the grid is held at once
+        grid_samples = itertools.chain.from_iterable(
+            self._samples_in(start, min(start + GRID_BLOCK_SIZE, self._grid_size))
+            for start in range(0, self._grid_size, GRID_BLOCK_SIZE)
+        )
+        for iteration, sample in enumerate(grid_samples, 1):
+            value, completed = self._evaluate_sample(objective_function, sample, iteration, max_iterations,
+                                                     samples, values, context)
+            if not completed:
+                break
+            yield value, sample
+
+        self._end_optimization(samples, values, context)
+
     def _traverse_grid(self, variable, sample_num, context=None):
         """Get next sample from grid.
         This is assigned as the `search_function <OptimizationFunction.search_function>` of the `OptimizationFunction`.
         """
         if self.is_initializing:
             return [signal.start for signal in self.search_space]
-        try:
-            sample = next(self.grid)
-        except StopIteration:
+        if sample_num >= self._grid_size:
             raise OptimizationFunctionError("Expired grid in {} run from {} "
                                             "(execution_count: {}; num_iterations: {})".
                 format(self.__class__.__name__, self.owner.name,
                        self.owner.parameters.execution_count.get(), self.num_iterations))
-        return sample
+        return self._sample_at(sample_num)
 
     def _grid_complete(self, variable, value, iteration, context=None):
         """Return False when search of grid is complete
         This is assigned as the `search_termination_function <OptimizationFunction.search_termination_function>`
         of the `OptimizationFunction`.
         """
-        try:
-            return iteration == self.num_iterations
-        except AttributeError:
-            return True
+        return iteration == self.num_iterations
 
 
 class GaussianProcess(OptimizationFunction):
@@ -1931,13 +2064,12 @@ class GaussianProcess(OptimizationFunction):
 
     # TODO: should save_values be in the constructor if it's ignored?
     # is False or True the correct value?
-    @tc.typecheck
     def __init__(self,
                  default_variable=None,
-                 objective_function:tc.optional(is_function_type)=None,
+                 objective_function=None,
                  search_space=None,
-                 direction:tc.optional(tc.enum(MAXIMIZE, MINIMIZE))=None,
-                 save_values:tc.optional(bool)=None,
+                 direction=None,
+                 save_values=None,
                  params=None,
                  owner=None,
                  prefs=None,
@@ -1947,7 +2079,6 @@ class GaussianProcess(OptimizationFunction):
         search_termination_function = self._gaussian_process_satisfied
         self._return_values = save_values
         self._return_samples = save_values
-        self.direction = direction
 
         super().__init__(
             default_variable=default_variable,
@@ -1957,6 +2088,7 @@ class GaussianProcess(OptimizationFunction):
             search_termination_function=search_termination_function,
             save_samples=True,
             save_values=save_values,
+            direction=direction,
             params=params,
             owner=owner,
             prefs=prefs,
@@ -1964,6 +2096,7 @@ class GaussianProcess(OptimizationFunction):
 
     def _validate_params(self, request_set, target_set=None, context=None):
         super()._validate_params(request_set=request_set, target_set=target_set,context=context)
+        _validate_optimization_direction(self, request_set)
         # if SEARCH_SPACE in request_set:
         #     search_space = request_set[SEARCH_SPACE]
         #     # search_space must be specified
@@ -2017,7 +2150,8 @@ class GaussianProcess(OptimizationFunction):
             samples in the order they were evaluated; otherwise it is empty.
         """
 
-        return_all_samples = return_all_values = []
+        return_all_samples = []
+        return_all_values = []
 
         # Enforce no MPI for now
         MPI_IMPLEMENTATION = False
@@ -2429,7 +2563,8 @@ class ParamEstimationFunction(OptimizationFunction):
         """
 
         # Initialize the list of all samples and values
-        return_all_samples = return_all_values = []
+        return_all_samples = []
+        return_all_values = []
 
         # Intialize the optimial control allocation sample and value to zero.
         return_optimal_sample = np.zeros(len(self.search_space))
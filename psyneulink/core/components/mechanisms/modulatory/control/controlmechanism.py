@@ -1176,29 +1176,50 @@ class ControlMechanism(ModulatoryMechanism_Base):
             # method?
             # validate_monitored_port_spec(self._owner, input_ports)
 
-    @tc.typecheck
     def __init__(self,
                  default_variable=None,
                  size=None,
-                 monitor_for_control:tc.optional(tc.any(is_iterable, Mechanism, OutputPort))=None,
+                 monitor_for_control=None,
                  objective_mechanism=None,
                  function=None,
-                 default_allocation:tc.optional(tc.any(int, float, list, np.ndarray))=None,
-                 control:tc.optional(tc.any(is_iterable,
-                                            ParameterPort,
-                                            InputPort,
-                                            OutputPort,
-                                            ControlSignal))=None,
-                 modulation:tc.optional(str)=None,
-                 combine_costs:tc.optional(is_function_type)=None,
-                 compute_reconfiguration_cost:tc.optional(is_function_type)=None,
+                 default_allocation=None,
+                 control=None,
+                 modulation=None,
+                 combine_costs=None,
+                 compute_reconfiguration_cost=None,
                  compute_net_outcome=None,
                  params=None,
                  name=None,
-                 prefs:tc.optional(is_pref_set)=None,
+                 prefs=None,
                  **kwargs
                  ):
 
+        if not (monitor_for_control is None
+                or is_iterable(monitor_for_control)
+                or isinstance(monitor_for_control, (Mechanism, OutputPort))):
+            raise ControlMechanismError(f"The 'monitor_for_control' arg of {self.__class__.__name__} must be a "
+                                        f"{Mechanism.__name__}, {OutputPort.__name__}, or list of them "
+                                        f"(got {monitor_for_control}).")
+        if not (default_allocation is None or isinstance(default_allocation, (int, float, list, np.ndarray))):
+            raise ControlMechanismError(f"The 'default_allocation' arg of {self.__class__.__name__} must be a "
+                                        f"number, list or array (got {default_allocation}).")
+        if not (control is None
+                or is_iterable(control)
+                or isinstance(control, (ParameterPort, InputPort, OutputPort, ControlSignal))):
+            raise ControlMechanismError(f"The 'control' arg of {self.__class__.__name__} must be a "
+                                        f"{ControlSignal.__name__} specification or list of them (got {control}).")
+        if not (modulation is None or isinstance(modulation, str)):
+            raise ControlMechanismError(f"The 'modulation' arg of {self.__class__.__name__} must be a str "
+                                        f"(got {modulation}).")
+        for arg_name, arg in (('combine_costs', combine_costs),
+                              ('compute_reconfiguration_cost', compute_reconfiguration_cost)):
+            if arg is not None and not is_function_type(arg):
+                raise ControlMechanismError(f"The {repr(arg_name)} arg of {self.__class__.__name__} must be a "
+                                            f"function or method (got {arg}).")
+        if not (prefs is None or is_pref_set(prefs)):
+            raise ControlMechanismError(f"The 'prefs' arg of {self.__class__.__name__} must be a PreferenceSet or "
+                                        f"specification dict (got {prefs}).")
+
         monitor_for_control = convert_to_list(monitor_for_control) or []
         control = convert_to_list(control) or []
 
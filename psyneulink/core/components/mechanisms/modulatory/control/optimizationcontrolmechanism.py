@@ -396,7 +396,7 @@ from collections.abc import Iterable
 from psyneulink.core.components.component import DefaultsFlexibility
 from psyneulink.core.components.functions.function import is_function_type, FunctionError
 from psyneulink.core.components.functions.optimizationfunctions import \
-    OBJECTIVE_FUNCTION, SEARCH_SPACE
+    OBJECTIVE_FUNCTION, SEARCH_FUNCTION, SEARCH_SPACE, SEARCH_TERMINATION_FUNCTION
 from psyneulink.core.components.functions.combinationfunctions import LinearCombination
 from psyneulink.core.components.functions.transferfunctions import CostFunctions
 from psyneulink.core.components.mechanisms.mechanism import Mechanism
@@ -427,6 +427,7 @@ __all__ = [
 
 AGENT_REP = 'agent_rep'
 FEATURES = 'features'
+FEATURE_FUNCTION = 'feature_function'
 
 
 def _parse_feature_values_from_variable(variable):
@@ -709,20 +710,31 @@ class OptimizationControlMechanism(ControlMechanism):
         saved_values = None
 
     @handle_external_context()
-    @tc.typecheck
     def __init__(self,
                  agent_rep=None,
                  function=None,
-                 features: tc.optional(tc.optional(tc.any(Iterable, Mechanism, OutputPort, InputPort))) = None,
-                 feature_function: tc.optional(tc.optional(tc.any(is_function_type))) = None,
+                 features=None,
+                 feature_function=None,
                  num_estimates = None,
-                 search_function: tc.optional(tc.optional(tc.any(is_function_type))) = None,
-                 search_termination_function: tc.optional(tc.optional(tc.any(is_function_type))) = None,
+                 search_function=None,
+                 search_termination_function=None,
                  search_statefulness=None,
                  context=None,
                  **kwargs):
         """Implement OptimizationControlMechanism"""
 
+        if features is not None and not isinstance(features, (Iterable, Mechanism, OutputPort, InputPort)):
+            raise OptimizationControlMechanismError(f"The {repr(FEATURES)} arg of an {self.__class__.__name__} must "
+                                                    f"be a {Mechanism.__name__}, {OutputPort.__name__}, "
+                                                    f"{InputPort.__name__}, or list of them (got {features}).")
+        for arg_name, arg in ((FEATURE_FUNCTION, feature_function),
+                              (SEARCH_FUNCTION, search_function),
+                              (SEARCH_TERMINATION_FUNCTION, search_termination_function)):
+            if arg is not None and not is_function_type(arg):
+                raise OptimizationControlMechanismError(f"The {repr(arg_name)} arg of an "
+                                                        f"{self.__class__.__name__} must be a function or method "
+                                                        f"(got {arg}).")
+
         # If agent_rep hasn't been specified, put into deferred init
         if agent_rep is None:
             if context.source==ContextFlags.COMMAND_LINE:
@@ -7255,7 +7255,10 @@ class Composition(Composition_Base, metaclass=ComponentsMeta):
             newarr = np.reshape(arr, newshape)
             arr = tuple(newarr[i].item() for i in range(len(newarr)))
 
-        return np.array(arr)
+        # An allocation that is already an array is not copied:  _apply_control_allocation stores its rows (as views)
+        #    in the controller's value, which is only ever replaced (never modified in place), and the
+        #    OptimizationFunction that passed in the candidate does not modify it while it is being evaluated
+        return np.asarray(arr)
 
     def _get_total_cost_of_control_allocation(self, control_allocation, context, runtime_params):
         total_cost = 0.
@@ -131,6 +131,7 @@ def init_builtins():
         builtins.setup_pnl_intrinsics(ctx)
         builtins.setup_vxm(ctx)
         builtins.setup_vxm_transposed(ctx)
+        builtins.setup_outer_product_add(ctx)
         builtins.setup_mersenne_twister(ctx)
         builtins.setup_vec_add(ctx)
         builtins.setup_mat_add(ctx)
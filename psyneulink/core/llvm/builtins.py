@@ -109,6 +109,36 @@ def setup_vxm_transposed(ctx):
     builder.ret_void()
 
 
+def setup_outer_product_add(ctx):
+    # Setup types
+    double_ptr_ty = ctx.float_ty.as_pointer()
+    # Arguments (given a vector of size X, a vector of size Y,
+    #            and X by Y matrix):
+    # 1) Vector ptr (X)
+    # 2) Vector ptr (Y)
+    # 3) X dimension size
+    # 4) Y dimension size
+    # 5) Matrix ptr, accumulates the outer product in place
+    builder = _setup_builtin_func_builder(ctx, "outer_product_add", (double_ptr_ty, double_ptr_ty, ctx.int32_ty, ctx.int32_ty, double_ptr_ty))
+    u, v, x, y, m = builder.function.args
+
+    with helpers.for_loop_zero_inc(builder, x, "outer_product_outer") as (b1, index_i):
+        # The row element is loop invariant in the inner loop
+        u_el = b1.load(b1.gep(u, [index_i]))
+        row_index = b1.mul(index_i, y)
+        with helpers.for_loop_zero_inc(b1, y, "outer_product_inner") as (b2, index_j):
+            v_el = b2.load(b2.gep(v, [index_j]))
+            matrix_ptr = b2.gep(m, [b2.add(row_index, index_j)])
+            matrix_el = b2.load(matrix_ptr)
+
+            new_el = b2.fmul(u_el, v_el)
+            new_el = b2.fadd(matrix_el, new_el)
+
+            b2.store(new_el, matrix_ptr)
+
+    builder.ret_void()
+
+
 # Setup vector addition builtin
 def setup_vec_add(ctx):
     # Setup types
@@ -13,9 +13,9 @@ from psyneulink.core.globals.context import Context
 from collections import Counter
 import copy
 import ctypes
+import functools
 import numpy as np
 from inspect import isgenerator
-import itertools
 import sys
 
 
@@ -45,6 +45,31 @@ def _tupleize(x):
     except TypeError:
         return x if x is not None else tuple()
 
+# Only the most recent grid is kept, so that a large grid isn't held once its allocation samples change
+@functools.lru_cache(maxsize=1)
+def _cartesian_product(axes, dtype=np.float64):
+    """Return the cartesian product of **axes** (a tuple of tuples) as a contiguous (num_samples x num_axes) array
+    of **dtype**, in the same order as itertools.product (last axis varies fastest).
+    Each column is filled by repeating and tiling the values of its axis, so no intermediate tuples are created.
+    The result for the most recent **axes** and **dtype** is cached, and so is read-only.
+    """
+    axes = [np.asarray(axis, dtype=dtype) for axis in axes]
+    num_samples = 1
+    for axis in axes:
+        num_samples *= len(axis)
+    product = np.empty((num_samples, len(axes)), dtype=dtype)
+    if num_samples == 0:
+        product.flags.writeable = False
+        return product
+
+    inner = num_samples
+    for i, axis in enumerate(axes):
+        inner //= len(axis)
+        outer = num_samples // (inner * len(axis))
+        product[:, i] = np.tile(np.repeat(axis, inner), outer)
+    product.flags.writeable = False
+    return product
+
 def _pretty_size(size):
     units = ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB']
     for u in units:
@@ -635,9 +660,13 @@ class CompExecution(CUDAExecution):
         # all but #2 and #3 are shared
         ct_comp_param = bin_func.byref_arg_types[0](*ocm.agent_rep._get_param_initializer(context))
         ct_comp_state = bin_func.byref_arg_types[1](*ocm.agent_rep._get_state_initializer(context))
-        # Make sure the dtype matches _gen_llvm_evaluate_function
-        allocations = np.asfarray(np.atleast_2d([*itertools.product(*search_space)]))
-        ct_allocations = allocations.ctypes.data_as(ctypes.POINTER(bin_func.byref_arg_types[2] * len(allocations)))
+        # Make sure the dtype matches _gen_llvm_evaluate_function (i.e., the float type of the compiled allocations),
+        #    rather than always using float64
+        # The grid is the same for every evaluation unless the allocation samples change, so it is cached by their values
+        allocation_dtype = np.dtype(bin_func.byref_arg_types[2]._type_)
+        allocations = _cartesian_product(tuple(tuple(axis) for axis in search_space), allocation_dtype)
+        ct_allocations_ty = bin_func.byref_arg_types[2] * len(allocations)
+        ct_allocations = allocations.ctypes.data_as(ctypes.POINTER(ct_allocations_ty))
         out_ty = bin_func.byref_arg_types[3] * len(allocations)
         ct_in = variable.ctypes.data_as(ctypes.POINTER(bin_func.byref_arg_types[4]))
 
@@ -654,4 +683,6 @@ class CompExecution(CUDAExecution):
         bin_func.cuda_call(*cuda_args, threads=len(allocations))
         ct_results = self.download_ctype(cuda_args[3], out_ty, 'result')
 
-        return ct_allocations.contents, ct_results
+        # The cached grid is only uploaded;  the caller gets its own copy of the allocations,
+        #    so that changes to the samples it returns can't alter the cache
+        return ct_allocations_ty.from_buffer_copy(allocations), ct_results
@@ -428,45 +428,50 @@ class KWTAMechanism(RecurrentTransferMechanism):
         ratio = self._get_current_mechanism_param("ratio", context)
         inhibition_only = self._get_current_mechanism_param("inhibition_only", context)
 
-        try:
-            int_k_value = int(k_value[0])
-        except TypeError: # if k_value is a single value rather than a list or array
-            int_k_value = int(k_value)
-        # ^ this is hacky but necessary for now, since something is
-        # incorrectly turning k_value into an array of floats
+        # k_value may arrive as a single value or as a one-element array
+        k_num = np.ravel(k_value)[0]
+        int_k_value = int(k_num)
         n = self.size[0]
-        if (k_value[0] > 0) and (k_value[0] < 1):
-            k = int(round(k_value[0] * n))
+        if 0 < k_num < 1:
+            k = int(round(k_num * n))
         elif (int_k_value < 0):
             k = n - int_k_value
         else:
             k = int_k_value
         # k = self.int_k
 
-        diffs = threshold - current_input[0]
-
-        sorted_diffs = sorted(diffs)
+        # convert once so the subtraction, selection and rescaling below are
+        # all ufuncs on the same array
+        input_row = np.asarray(current_input[0], dtype=float)
+        diffs = threshold - input_row
 
         if average_based:
-            top_k_mean = np.mean(sorted_diffs[0:k])
-            other_mean = np.mean(sorted_diffs[k:n])
+            # the means only need the k smallest diffs separated from the
+            # rest, not the diffs in sorted order
+            if 0 < k < len(diffs):
+                diffs = np.partition(diffs, k)
+            top_k_mean = np.mean(diffs[0:k])
+            other_mean = np.mean(diffs[k:n])
             final_diff = other_mean * ratio + top_k_mean * (1 - ratio)
         else:
-            if k == 0:
-                final_diff = sorted_diffs[k]
-            elif k == len(sorted_diffs):
-                final_diff = sorted_diffs[k - 1]
-            elif k > len(sorted_diffs):
+            # only the (k-1)th and kth smallest diffs are needed, so select
+            # them with a partition rather than sorting all of them
+            if k > len(diffs):
                 raise KWTAError("k value ({}) is greater than the length of the first input ({}) for KWTAMechanism mechanism {}".
                                 format(k, current_input[0], self.name))
+            elif k == 0:
+                final_diff = np.min(diffs)
+            elif k == len(diffs):
+                final_diff = np.max(diffs)
             else:
-                final_diff = sorted_diffs[k] * ratio + sorted_diffs[k - 1] * (1 - ratio)
+                partitioned_diffs = np.partition(diffs, (k - 1, k))
+                final_diff = partitioned_diffs[k] * ratio + partitioned_diffs[k - 1] * (1 - ratio)
 
         if inhibition_only and final_diff > 0:
             final_diff = 0
 
-        new_input = np.array(current_input[0] + final_diff)
-        if (sum(new_input > threshold) > k) and not average_based:
+        new_input = input_row + final_diff
+        if not average_based and np.count_nonzero(new_input > threshold) > k:
             warnings.warn("KWTAMechanism scaling was not successful: the result was too high. The original input was {}, "
                           "and the KWTAMechanism-scaled result was {}".format(current_input, new_input))
         new_input = list(new_input)
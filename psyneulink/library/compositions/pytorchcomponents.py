@@ -3,6 +3,7 @@ from psyneulink.library.compositions.pytorchllvmhelper import *
 from psyneulink.core.globals.log import LogCondition
 from psyneulink.core import llvm as pnlvm
 
+import numpy as np
 import torch
 
 __all__ = ['PytorchMechanismWrapper', 'PytorchProjectionWrapper']
@@ -29,14 +30,20 @@ def pytorch_function_creator(function, device, context=None):
         gain = get_fct_param_value('gain')
         bias = get_fct_param_value('bias')
         offset = get_fct_param_value('offset')
-        return lambda x: 1 / (1 + torch.exp(-gain * (x + bias) + offset))
+        # 1 / (1 + exp(-gain * (x + bias) + offset)) as a single fused op
+        return lambda x: torch.sigmoid(gain * (x + bias) - offset)
 
     elif isinstance(function, ReLU):
         gain = get_fct_param_value('gain')
         bias = get_fct_param_value('bias')
         leak = get_fct_param_value('leak')
-        return lambda x: (torch.max(input=(x - bias), other=torch.tensor([0], device=device).double()) * gain +
-                            torch.min(input=(x - bias), other=torch.tensor([0], device=device).double()) * leak)
+        # allocate the comparison tensor once rather than on every call
+        zero = torch.tensor([0], device=device).double()
+
+        def relu(x):
+            x = x - bias
+            return torch.max(input=x, other=zero) * gain + torch.min(input=x, other=zero) * leak
+        return relu
 
     else:
         raise Exception(f"Function {function} is not currently supported in AutodiffCompositions!")
@@ -157,9 +164,15 @@ class PytorchProjectionWrapper():
             matrix = projection.parameters.matrix.get(
                 context=None
             )
-        self.matrix = torch.nn.Parameter(torch.tensor(matrix.copy(),
+        # torch.tensor always copies its data, so the PsyNeuLink matrix is
+        # never aliased;  ascontiguousarray only copies a matrix that is not
+        # already contiguous (torch.tensor rejects negative strides)
+        self.matrix = torch.nn.Parameter(torch.tensor(np.ascontiguousarray(matrix),
                                          device=device,
                                          dtype=torch.double))
+        # Shape is fixed for the lifetime of the wrapper; avoids going through
+        # detach().numpy() every time the matrix is extracted during codegen
+        self._matrix_shape = tuple(self.matrix.shape)
 
         if projection.learnable is False:
             self.matrix.requires_grad = False
@@ -178,14 +191,14 @@ class PytorchProjectionWrapper():
                                            ctx.int32_ty(1),
                                            ctx.int32_ty(self._idx)])
 
-        dim_x, dim_y = self.matrix.detach().numpy().shape
+        dim_x, dim_y = self._matrix_shape
         proj_matrix = pnlvm.helpers.get_param_ptr(builder, self._projection, proj_params, "matrix")
         proj_matrix = builder.bitcast(proj_matrix, pnlvm.ir.types.ArrayType(
             pnlvm.ir.types.ArrayType(ctx.float_ty, dim_y), dim_x).as_pointer())
 
         return proj_matrix
 
-    def _gen_llvm_execute(self, ctx, builder, state, params, data):
+    def _gen_llvm_execute(self, ctx, builder, state, params, data, output_vec=None):
         proj_matrix = self._extract_llvm_matrix(ctx, builder, params)
 
         input_vec = builder.gep(data, [ctx.int32_ty(0),
@@ -193,7 +206,7 @@ class PytorchProjectionWrapper():
                                        ctx.int32_ty(self.sender._idx),
                                        ctx.int32_ty(self._port_idx)])
 
-        output_vec = gen_inject_vxm(ctx, builder, input_vec, proj_matrix)
+        output_vec = gen_inject_vxm(ctx, builder, input_vec, proj_matrix, output_vec)
 
         pnlvm.helpers.printf_float_array(builder, input_vec, prefix=f"{self.sender._mechanism} -> {self.receiver._mechanism} input:\n", override_debug=False)
         pnlvm.helpers.printf_float_matrix(builder, proj_matrix, prefix=f"{self.sender._mechanism} -> {self.receiver._mechanism} mat:\n", override_debug=False)
@@ -12,7 +12,8 @@ __all__ = ["gen_inject_unary_function_call",
            "gen_inject_mat_hadamard",
            "gen_inject_mat_scalar_mult",
            "gen_inject_vxm",
-           "gen_inject_vxm_transposed"]
+           "gen_inject_vxm_transposed",
+           "gen_inject_vec_outer_product_add"]
 
 def gen_inject_unary_function_call(ctx, builder, unary_func, vector, output_vec=None):
     dim = len(vector.type.pointee)
@@ -144,3 +145,18 @@ def gen_inject_vxm_transposed(ctx, builder, m1, m2, output_vec=None):
     builder.call(builtin, [v, builder.bitcast(m2, ctx.float_ty.as_pointer()),
                             ctx.int32_ty(y), ctx.int32_ty(z), out])
     return output_vec
+
+def gen_inject_vec_outer_product_add(ctx, builder, u, v, output_mat):
+    x = len(output_mat.type.pointee)
+    y = len(output_mat.type.pointee.element)
+    assert len(u.type.pointee) == x
+    assert len(v.type.pointee) == y
+
+    # Get the pointer to the first element of the array to convert from [? x double]* -> double*
+    vec_u = builder.gep(u, [ctx.int32_ty(0), ctx.int32_ty(0)])
+    vec_v = builder.gep(v, [ctx.int32_ty(0), ctx.int32_ty(0)])
+
+    builtin = ctx.import_llvm_function("__pnl_builtin_outer_product_add")
+    builder.call(builtin, [vec_u, vec_v, ctx.int32_ty(x), ctx.int32_ty(y),
+                           builder.bitcast(output_mat, ctx.float_ty.as_pointer())])
+    return output_mat
@@ -39,9 +39,16 @@ class PytorchModelCreator(torch.nn.Module):
         self.device = device
         self._composition = composition
 
+        # Composition._get_node_index and list.index are linear scans, so
+        # resolve the struct indices of all nodes and projections up front
+        self._node_index = {node: idx for idx, node in enumerate(composition._all_nodes)}
+        projection_index = {proj: idx for idx, proj in enumerate(composition._inner_projections)}
+
+        learning_nodes = set(composition.get_nodes_by_role(NodeRole.LEARNING))
+
         # Instantiate pytorch mechanisms
-        for node in set(composition.nodes) - set(composition.get_nodes_by_role(NodeRole.LEARNING)):
-            pytorch_node = PytorchMechanismWrapper(node, self._composition._get_node_index(node), device, context=context)
+        for node in set(composition.nodes) - learning_nodes:
+            pytorch_node = PytorchMechanismWrapper(node, self._node_index[node], device, context=context)
             self.component_map[node] = pytorch_node
             self.nodes.append(pytorch_node)
 
@@ -52,7 +59,7 @@ class PytorchModelCreator(torch.nn.Module):
                 proj_recv = self.component_map[projection.receiver.owner]
 
                 port_idx = projection.sender.owner.output_ports.index(projection.sender)
-                new_proj = PytorchProjectionWrapper(projection, list(self._composition._inner_projections).index(projection), port_idx, device, sender=proj_send, receiver=proj_recv, context=context)
+                new_proj = PytorchProjectionWrapper(projection, projection_index[projection], port_idx, device, sender=proj_send, receiver=proj_recv, context=context)
                 proj_send.add_efferent(new_proj)
                 proj_recv.add_afferent(new_proj)
                 self.projection_map[projection] = new_proj
@@ -61,15 +68,17 @@ class PytorchModelCreator(torch.nn.Module):
 
         # Setup execution sets
         # 1) Remove all learning-specific nodes
-        self.execution_sets = [x - set(composition.get_nodes_by_role(NodeRole.LEARNING)) for x in composition.scheduler.run(context=context)]
+        self.execution_sets = [x - learning_nodes for x in composition.scheduler.run(context=context)]
         # 2) Convert to pytorchcomponent representation
         self.execution_sets = [{self.component_map[comp] for comp in s if comp in self.component_map} for s in self.execution_sets]
         # 3) Remove empty execution sets
         self.execution_sets = [x for x in self.execution_sets if len(x) > 0]
 
-    # gets the index of 'afferent_node' in the forward info weights list
-    def _get_afferent_node_index(self, node, afferent_node):
-        return [proj.receiver for proj in node.afferents].index(self.component_map[afferent_node])
+        # Node roles are fixed for the lifetime of the model, resolve them
+        # once instead of on every forward pass and LLVM code generation
+        self._input_nodes = set(composition.get_nodes_by_role(NodeRole.INPUT))
+        self._input_node_index = {node: idx for idx, node in enumerate(composition.get_nodes_by_role(NodeRole.INPUT))}
+        self._output_nodes = set(composition.get_nodes_by_role(NodeRole.OUTPUT))
 
     def _get_afferent_nodes(self, node):
         forward_info_weights = self.component_map[node].afferents
@@ -87,7 +96,7 @@ class PytorchModelCreator(torch.nn.Module):
         if "learning" in tags:
             self._gen_llvm_training_function_body(ctx, builder, state, params, data)
         else:
-            model_input = builder.gep(data, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(self._composition._get_node_index(self._composition.input_CIM))])
+            model_input = builder.gep(data, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(self._node_index[self._composition.input_CIM])])
             self._gen_llvm_forward_function_body(ctx, builder, state, params, model_input, data)
 
         builder.ret_void()
@@ -95,14 +104,20 @@ class PytorchModelCreator(torch.nn.Module):
 
     def _gen_llvm_forward_function_body(self, ctx, builder, state, params, arg_in, data):
         z_values = {}  # dict for storing values of terminal (output) nodes
+        # Mechanism inputs are dead once the mechanism has executed, so
+        # a single stack slot per input type is shared by all components
+        input_allocas = {}
         for current_exec_set in self.execution_sets:
             for component in current_exec_set:
                 mech_input_ty = ctx.get_input_struct_type(component._mechanism)
-                variable = builder.alloca(mech_input_ty)
-                z_values[component] = builder.alloca(mech_input_ty.elements[0].elements[0])
+                with builder.goto_entry_block():
+                    if mech_input_ty not in input_allocas:
+                        input_allocas[mech_input_ty] = builder.alloca(mech_input_ty)
+                    z_values[component] = builder.alloca(mech_input_ty.elements[0].elements[0])
+                variable = input_allocas[mech_input_ty]
                 builder.store(z_values[component].type.pointee(None),z_values[component])
 
-                if NodeRole.INPUT in self._composition.get_roles_by_node(component._mechanism):
+                if component._mechanism in self._input_nodes:
                     input_ptr = builder.gep(
                         variable, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(0)])
                     input_id = component._idx
@@ -111,9 +126,8 @@ class PytorchModelCreator(torch.nn.Module):
                 for (proj_idx, proj) in enumerate(component.afferents):
                     input_ptr = builder.gep(
                         variable, [ctx.int32_ty(0), ctx.int32_ty(0), ctx.int32_ty(proj_idx)])
-                    proj_output = proj._gen_llvm_execute(ctx, builder, state, params, data)
-                    # store in input ports struct
-                    builder.store(builder.load(proj_output), input_ptr)
+                    # write the projection output straight into the input ports struct
+                    proj_output = proj._gen_llvm_execute(ctx, builder, state, params, data, input_ptr)
                     # HACK: Add to z_values struct
                     gen_inject_vec_add(ctx, builder, proj_output, z_values[component], z_values[component])
                 component._gen_llvm_execute(ctx, builder, state, params, variable, data)
@@ -138,11 +152,8 @@ class PytorchModelCreator(torch.nn.Module):
         state, params, data, optim_struct = llvm_func.args
         model_input = builder.gep(data, [ctx.int32_ty(0),
                                          ctx.int32_ty(0),
-                                         ctx.int32_ty(self._composition._get_node_index(self._composition.input_CIM))])
+                                         ctx.int32_ty(self._node_index[self._composition.input_CIM])])
         model_output = data
-        # setup useful mappings
-        input_nodes = set(self._composition.get_nodes_by_role(NodeRole.INPUT))
-
         # initialize optimizer params:
         delta_w = builder.gep(optim_struct, [ctx.int32_ty(0), ctx.int32_ty(optimizer._DELTA_W_NUM)])
 
@@ -158,21 +169,20 @@ class PytorchModelCreator(torch.nn.Module):
         error_dict = {}
         for exec_set in reversed(self.execution_sets):
             for node in exec_set:
-                if node._mechanism in input_nodes:
+                if node._mechanism in self._input_nodes:
                     continue
                 node_z_value = z_values[node]
                 activation_func_derivative = node._gen_llvm_execute_derivative_func(ctx, builder, state, params, node_z_value)
                 error_val = builder.alloca(z_values[node].type.pointee)
                 error_dict[node] = error_val
 
-                if NodeRole.OUTPUT in self._composition.get_roles_by_node(node._mechanism):
+                if node._mechanism in self._output_nodes:
                     # We handle output layer here
                     # compute  dC/da = a_l - y(x) (TODO: Allow other cost functions! This only applies to MSE)
 
                     # 1) Lookup desired target value
                     terminal_sequence = self._composition._terminal_backprop_sequences[node._mechanism]
-                    target_idx = self._composition.get_nodes_by_role(
-                        NodeRole.INPUT).index(terminal_sequence[TARGET_MECHANISM])
+                    target_idx = self._input_node_index[terminal_sequence[TARGET_MECHANISM]]
                     node_target = builder.gep(model_input, [ctx.int32_ty(0), ctx.int32_ty(target_idx)])
 
                     # 2) Lookup desired output value
@@ -225,7 +235,7 @@ class PytorchModelCreator(torch.nn.Module):
 
         # 4) compute weight gradients
         for (node, err_val) in error_dict.items():
-            if node in input_nodes:
+            if node._mechanism in self._input_nodes:
                 continue
             for proj in node.afferents:
                 # get a_(l-1)
@@ -237,18 +247,8 @@ class PytorchModelCreator(torch.nn.Module):
                 # update delta_W
                 node_delta_w = builder.gep(delta_w, [ctx.int32_ty(0), ctx.int32_ty(proj._idx)])
 
-                dim_x, dim_y = proj.matrix.shape
-                with pnlvm.helpers.for_loop_zero_inc(builder, ctx.int32_ty(dim_x), "weight_update_loop_outer") as (b1, weight_row):
-                    with pnlvm.helpers.for_loop_zero_inc(b1, ctx.int32_ty(dim_y), "weight_update_loop_inner") as (b2, weight_column):
-                        a_val = b2.load(b2.gep(afferent_node_activation,
-                                               [ctx.int32_ty(0), weight_row]))
-                        d_val = b2.load(b2.gep(err_val,
-                                               [ctx.int32_ty(0), weight_column]))
-                        old_val = b2.load(b2.gep(node_delta_w,
-                                                 [ctx.int32_ty(0), weight_row, weight_column]))
-                        new_val = b2.fadd(old_val, b2.fmul(a_val, d_val))
-                        b2.store(new_val, b2.gep(node_delta_w,
-                                                 [ctx.int32_ty(0), weight_row, weight_column]))
+                gen_inject_vec_outer_product_add(
+                    ctx, builder, afferent_node_activation, err_val, node_delta_w)
 
         pnlvm.helpers.printf(builder, "TOTAL LOSS:\t%.20f\n",
                              builder.load(total_loss), override_debug=False)
@@ -297,14 +297,14 @@ class PytorchModelCreator(torch.nn.Module):
         outputs = {}  # dict for storing values of terminal (output) nodes
         for current_exec_set in self.execution_sets:
             for component in current_exec_set:
-                if NodeRole.INPUT in self._composition.get_roles_by_node(component._mechanism):
+                if component._mechanism in self._input_nodes:
                     component.execute(inputs[component._mechanism])
                 else:
                     variable = component.collate_afferents()
                     component.execute(variable)
 
                 # save value in output list if we're at a node in the last execution set
-                if NodeRole.OUTPUT in self._composition.get_roles_by_node(component._mechanism):
+                if component._mechanism in self._output_nodes:
                     outputs[component._mechanism] = component.value
 
         # NOTE: Context source needs to be set to COMMAND_LINE to force logs to update independantly of timesteps
@@ -322,10 +322,9 @@ class PytorchModelCreator(torch.nn.Module):
 
     def copy_weights_to_psyneulink(self, context=None):
         for projection, pytorch_rep in self.projection_map.items():
-            projection.parameters.matrix._set(
-                pytorch_rep.matrix.detach().cpu().numpy(), context)
-            projection.parameter_ports['matrix'].parameters.value._set(
-                pytorch_rep.matrix.detach().cpu().numpy(), context)
+            detached_matrix = pytorch_rep.matrix.detach().cpu().numpy()
+            projection.parameters.matrix._set(detached_matrix, context)
+            projection.parameter_ports['matrix'].parameters.value._set(detached_matrix, context)
 
     def copy_outputs_to_psyneulink(self, outputs, context=None):
         for component, value in outputs.items():
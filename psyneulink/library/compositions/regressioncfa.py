@@ -342,35 +342,26 @@ class RegressionCFA(CompositionFunctionApproximator):
             it is differentiated using `autograd <https://github.com/HIPS/autograd>`_\\.grad().
         """
 
-        predicted_outcome=0
-
         prediction_vector = self.parameters.prediction_vector._get(context)
         num_estimates = num_estimates or 1
 
+        # Regression weights, and the prediction terms to which they apply, are the same for all estimates,
+        #    so concatenate the weights for each term once, in the order the term values are concatenated below
+        # FIX: THIS SHOULD GET A SAMPLE RATHER THAN JUST USE THE ONE RETURNED FROM ADAPT METHOD
+        #      OR SHOULD MULTIPLE SAMPLES BE DRAWN AND AVERAGED AT END OF ADAPT METHOD?
+        #      I.E., AVERAGE WEIGHTS AND THEN OPTIMIZE OR OTPIMZE FOR EACH SAMPLE OF WEIGHTS AND THEN AVERAGE?
+        terms = self.prediction_terms
+        weights = self.parameters.regression_weights._get(context)
+        w = np.concatenate([weights[prediction_vector.idx[term.value]] for term in terms])
+
+        # Get values (subvectors) for prediction terms for each estimate, and concatenate them into rows of a matrix
+        term_values = []
         for i in range(num_estimates):
-
-            # Get values (subvectors) for prediction terms and their corresponding regression weights
-            terms = self.prediction_terms
             term_values_dict = prediction_vector.compute_terms(control_allocation, context=context)
-            # FIX: THIS SHOULD GET A SAMPLE RATHER THAN JUST USE THE ONE RETURNED FROM ADAPT METHOD
-            #      OR SHOULD MULTIPLE SAMPLES BE DRAWN AND AVERAGED AT END OF ADAPT METHOD?
-            #      I.E., AVERAGE WEIGHTS AND THEN OPTIMIZE OR OTPIMZE FOR EACH SAMPLE OF WEIGHTS AND THEN AVERAGE?
-            weights = self.parameters.regression_weights._get(context)
-
-            v = np.array([])
-            w = np.array([])
-            # Concatenate values for each prediction term, and same for corresponding weights
-            for term_label, term_value in term_values_dict.items():
-                if term_label in terms:
-                    pv_enum_val = term_label.value
-                    item_idx = prediction_vector.idx[pv_enum_val]
-                    v = np.append(v, term_value.reshape(-1))
-                    w = np.append(w, weights[item_idx])
-            # Get predicted outcome for this esimtate and add to sum over estimates
-            predicted_outcome += np.dot(v,w)
-
-        # Compute average over estimates
-        predicted_outcome/=num_estimates
+            term_values.append(np.concatenate([term_values_dict[term].reshape(-1) for term in terms]))
+
+        # Get predicted outcomes for all estimates with a single matrix-vector product, and average over them
+        predicted_outcome = np.sum(np.dot(np.stack(term_values), w), axis=0) / num_estimates
 
         return predicted_outcome
 
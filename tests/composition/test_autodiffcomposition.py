@@ -481,6 +481,38 @@ class TestTrainingCorrectness:
                                          "epochs": eps}, bin_execute=mode)
 
 
+    # test whether compiled training (including the weight gradient updates of _gen_llvm_training_backprop)
+    #    matches Python training, for projections with non-square matrices
+    @pytest.mark.parametrize("mode", [pytest.param('LLVMRun', marks=pytest.mark.llvm)])
+    def test_compiled_training_matches_python(self, mode):
+        hid_m = np.arange(6).reshape(2, 3) / 10
+        out_m = np.arange(12).reshape(3, 4) / 20 - 0.3
+
+        inputs = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+        targets = np.array([[0, 1, 0, 1], [1, 0, 0, 1], [1, 0, 1, 0], [0, 1, 1, 0]])
+
+        results = []
+        for execution_mode in ['Python', mode]:
+            in_mech = TransferMechanism(name='in', default_variable=np.zeros(2))
+            hid_mech = TransferMechanism(name='hid', default_variable=np.zeros(3), function=Logistic())
+            out_mech = TransferMechanism(name='out', default_variable=np.zeros(4), function=Logistic())
+
+            comp = AutodiffComposition(learning_rate=0.5, optimizer_type='sgd')
+            comp.add_node(in_mech)
+            comp.add_node(hid_mech)
+            comp.add_node(out_mech)
+            comp.add_projection(sender=in_mech, projection=MappingProjection(matrix=hid_m.copy()), receiver=hid_mech)
+            comp.add_projection(sender=hid_mech, projection=MappingProjection(matrix=out_m.copy()), receiver=out_mech)
+
+            results.append(comp.learn(inputs={"inputs": {in_mech: inputs},
+                                              "targets": {out_mech: targets},
+                                              "epochs": 5}, bin_execute=execution_mode))
+
+        python_results, compiled_results = results
+        assert len(python_results) == len(compiled_results) == len(inputs)
+        for python_result, compiled_result in zip(python_results, compiled_results):
+            assert np.allclose(python_result, compiled_result)
+
     # tests whether semantic network created as autodiff composition learns properly
     @pytest.mark.benchmark(group="Semantic net")
     @pytest.mark.parametrize(
@@ -1,3 +1,4 @@
+import ctypes
 import functools
 import numpy as np
 import psyneulink as pnl
@@ -568,6 +569,25 @@ class TestControlMechanisms:
         for i in range(1,5):
             assert lvoc.input_ports[i].function.offset == 10.0
 
+    @pytest.mark.parametrize("arg_name", ['feature_function', 'search_function', 'search_termination_function'])
+    def test_ocm_invalid_function_arg(self, arg_name):
+        m = pnl.TransferMechanism()
+        with pytest.raises(pnl.OptimizationControlMechanismError) as error_text:
+            pnl.OptimizationControlMechanism(agent_rep=pnl.RegressionCFA,
+                                             features=[m.input_port],
+                                             control_signals=[(pnl.SLOPE, m)],
+                                             **{arg_name: 'not a function'})
+        assert f"The '{arg_name}' arg of an OptimizationControlMechanism must be a function or method" \
+               in str(error_text.value)
+
+    def test_ocm_invalid_features_arg(self):
+        m = pnl.TransferMechanism()
+        with pytest.raises(pnl.OptimizationControlMechanismError) as error_text:
+            pnl.OptimizationControlMechanism(agent_rep=pnl.RegressionCFA,
+                                             features=3,
+                                             control_signals=[(pnl.SLOPE, m)])
+        assert "The 'features' arg of an OptimizationControlMechanism must be" in str(error_text.value)
+
     @pytest.mark.control
     @pytest.mark.composition
     @pytest.mark.benchmark(group="Multilevel GridSearch")
@@ -1699,6 +1719,76 @@ class TestModelBasedOptimizationControlMechanisms:
         if benchmark.enabled:
             benchmark(comp.run, inputs, bin_execute=mode)
 
+    @pytest.mark.control
+    @pytest.mark.composition
+    @pytest.mark.llvm
+    @pytest.mark.cuda
+    def test_model_based_ocm_cuda_grid_samples(self):
+        A = pnl.ProcessingMechanism(name='A')
+        B = pnl.ProcessingMechanism(name='B')
+
+        comp = pnl.Composition(name='comp',
+                               controller_mode=pnl.BEFORE)
+        comp.add_linear_processing_pathway([A, B])
+
+        search_range = pnl.SampleSpec(start=0.25, stop=0.75, step=0.25)
+        control_signal = pnl.ControlSignal(projections=[(pnl.SLOPE, A)],
+                                           variable=1.0,
+                                           allocation_samples=search_range,
+                                           intensity_cost_function=pnl.Linear(slope=0.))
+
+        objective_mech = pnl.ObjectiveMechanism(monitor=[B])
+        ocm = pnl.OptimizationControlMechanism(agent_rep=comp,
+                                               features=[A.input_port],
+                                               objective_mechanism=objective_mech,
+                                               function=pnl.GridSearch(),
+                                               control_signals=[control_signal],
+                                               comp_execution_mode='PTX')
+        comp.add_controller(ocm)
+        comp.run(inputs={A: [[[1.0]]]})
+
+        # Each search of the grid returns its own samples, rather than the cached grid they are uploaded from
+        context = comp.most_recent_context
+        _, _, first_samples, _ = ocm.function._run_cuda_grid(ocm, None, context)
+        first_values = np.ctypeslib.as_array(first_samples).copy()
+        first_samples[0][0] = -1.0
+        _, _, second_samples, _ = ocm.function._run_cuda_grid(ocm, None, context)
+        assert ctypes.addressof(first_samples) != ctypes.addressof(second_samples)
+        assert np.array_equal(np.ctypeslib.as_array(second_samples), first_values)
+
+    @pytest.mark.control
+    @pytest.mark.composition
+    def test_model_based_ocm_evaluate_array_allocation(self):
+        A = pnl.ProcessingMechanism(name='A')
+        B = pnl.ProcessingMechanism(name='B')
+
+        comp = pnl.Composition(name='comp',
+                               controller_mode=pnl.BEFORE)
+        comp.add_linear_processing_pathway([A, B])
+
+        search_range = pnl.SampleSpec(start=0.25, stop=0.75, step=0.25)
+        control_signal = pnl.ControlSignal(projections=[(pnl.SLOPE, A)],
+                                           variable=1.0,
+                                           allocation_samples=search_range,
+                                           intensity_cost_function=pnl.Linear(slope=0.))
+
+        objective_mech = pnl.ObjectiveMechanism(monitor=[B])
+        ocm = pnl.OptimizationControlMechanism(agent_rep=comp,
+                                               features=[A.input_port],
+                                               objective_mechanism=objective_mech,
+                                               function=pnl.GridSearch(),
+                                               control_signals=[control_signal])
+        comp.add_controller(ocm)
+        comp.run(inputs={A: [[[1.0]]]})
+
+        # An allocation that is an array is not copied when it is applied, so evaluating it must leave it unchanged
+        context = comp.most_recent_context
+        sample = np.array([[0.5]])
+        outcome = ocm.evaluation_function(sample, context=context)
+        assert np.allclose(outcome, 0.5)
+        ocm.evaluation_function(np.array([[0.75]]), context=context)
+        assert np.array_equal(sample, [[0.5]])
+
     def test_model_based_ocm_with_buffer(self):
 
         A = pnl.ProcessingMechanism(name='A')
@@ -1,3 +1,4 @@
+import itertools
 import numpy as np
 import psyneulink.core.llvm as pnlvm
 import psyneulink.core.components.functions.function as Function
@@ -102,3 +103,134 @@ def test_grid_search(obj_func, metric, normalize, direction, selection, benchmar
 
     if benchmark.enabled:
         benchmark(f.function, variable)
+
+
+def _distance_from_one(sample):
+    return -np.sum((np.asarray(sample) - 1.0) ** 2)
+
+
+@pytest.mark.function
+@pytest.mark.optimization_function
+@pytest.mark.parametrize("save", [True, False])
+def test_grid_search_saved_values(save, monkeypatch):
+    # GridSearch evaluates the grid by streaming it, rather than by the generic optimization process,
+    #    whether or not the samples and values are saved
+    streamed = []
+    stream_grid = OPTFunctions.GridSearch._stream_grid
+
+    def record_stream_grid(self, *args, **kwargs):
+        streamed.append(self)
+        return stream_grid(self, *args, **kwargs)
+
+    def fail_optimization_process(self, *args, **kwargs):
+        raise AssertionError("GridSearch used the generic optimization process")
+
+    space = [SampleIterator([0.0, 0.5, 1.0]) for i in range(3)]
+    f = OPTFunctions.GridSearch(objective_function=_distance_from_one, default_variable=[0, 0, 0],
+                                search_space=space, direction=OPTFunctions.MAXIMIZE)
+    f.parameters.save_samples.set(save)
+    f.parameters.save_values.set(save)
+
+    monkeypatch.setattr(OPTFunctions.GridSearch, '_stream_grid', record_stream_grid)
+    monkeypatch.setattr(OPTFunctions.OptimizationFunction, '_function', fail_optimization_process)
+    sample, value, _, _ = f.function([0, 0, 0])
+    assert streamed == [f]
+
+    # The optimal sample is a tuple whether or not the samples and values are saved
+    assert sample == (1.0, 1.0, 1.0)
+    assert value == 0.0
+
+    if save:
+        grid = list(itertools.product(*[[0.0, 0.5, 1.0]] * 3))
+        assert f.saved_samples == grid
+        assert np.allclose(f.saved_values, [_distance_from_one(s) for s in grid])
+
+
+@pytest.mark.function
+@pytest.mark.optimization_function
+def test_grid_search_max_iterations():
+    space = [SampleIterator([0.0, 0.5, 1.0]) for i in range(3)]
+    f = OPTFunctions.GridSearch(objective_function=_distance_from_one, default_variable=[0, 0, 0],
+                                search_space=space, direction=OPTFunctions.MAXIMIZE)
+    f.parameters.max_iterations.set(5)
+    with pytest.warns(UserWarning, match="failed to converge after 5 iterations"):
+        sample, value, _, _ = f.function([0, 0, 0])
+
+    # Only the first max_iterations samples of the grid are considered
+    grid = list(itertools.product(*[[0.0, 0.5, 1.0]] * 3))
+    assert sample == grid[4]
+    assert f.saved_samples == grid[:5]
+    assert np.allclose(f.saved_values, [_distance_from_one(s) for s in grid[:5]])
+
+
+@pytest.mark.function
+@pytest.mark.optimization_function
+@pytest.mark.parametrize("replaced", [OPTFunctions.SEARCH_FUNCTION, OPTFunctions.SEARCH_TERMINATION_FUNCTION])
+def test_grid_search_replaced_search_functions(replaced, monkeypatch):
+    # GridSearch only streams its grid if neither its search_function nor its search_termination_function is replaced
+    def fail_stream_grid(self, *args, **kwargs):
+        raise AssertionError("GridSearch streamed its grid")
+
+    space = [SampleIterator([0.0, 0.5, 1.0]) for i in range(3)]
+    f = OPTFunctions.GridSearch(objective_function=_distance_from_one, default_variable=[0, 0, 0],
+                                search_space=space, direction=OPTFunctions.MAXIMIZE)
+    grid = list(itertools.product(*[[0.0, 0.5, 1.0]] * 3))
+
+    if replaced == OPTFunctions.SEARCH_FUNCTION:
+        # Traverse the grid in reverse order
+        def replacement(variable, sample_num):
+            return grid[len(grid) - 1 - sample_num]
+        expected_samples = grid[::-1]
+    else:
+        # Stop halfway through the grid
+        def replacement(variable, value, iteration):
+            return iteration == len(grid) // 2
+        expected_samples = grid[:len(grid) // 2]
+
+    f.reset({replaced: replacement, OPTFunctions.SEARCH_SPACE: space})
+    monkeypatch.setattr(OPTFunctions.GridSearch, '_stream_grid', fail_stream_grid)
+    f.function([0, 0, 0])
+
+    assert f.saved_samples == expected_samples
+
+
+@pytest.mark.function
+@pytest.mark.optimization_function
+@pytest.mark.parametrize("opt_func", [OPTFunctions.GridSearch, OPTFunctions.GaussianProcess])
+def test_optimization_function_invalid_direction(opt_func):
+    with pytest.raises(OPTFunctions.OptimizationFunctionError) as error_text:
+        opt_func(objective_function=_distance_from_one, direction='sideways')
+    assert "Specification of 'direction' arg for {} (sideways) must be 'maximize' or 'minimize'".\
+        format(opt_func.__name__) in str(error_text.value)
+
+
+@pytest.mark.function
+@pytest.mark.optimization_function
+@pytest.mark.parametrize("arg_name, arg, error_msg",
+                         [('objective_function', 'not a function', "must be a function or method"),
+                          ('save_values', 'yes', "must be a bool"),
+                          ('max_iterations', 2.5, "must be an int")])
+def test_optimization_function_invalid_args(arg_name, arg, error_msg):
+    with pytest.raises(OPTFunctions.OptimizationFunctionError) as error_text:
+        OPTFunctions.OptimizationFunction(**{arg_name: arg})
+    assert "Specification of {} arg for OptimizationFunction ({}) {}".format(repr(arg_name), arg, error_msg) \
+        in str(error_text.value)
+
+
+@pytest.mark.function
+@pytest.mark.optimization_function
+@pytest.mark.parametrize("axes", [[[0.0, 0.5, 1.0], [1, 2], [-1.0, 0.0, 1.0, 2.0]],
+                                  [[i / 4 for i in range(24)]]],
+                         ids=['3d', '1d'])
+def test_grid_search_samples_in(axes):
+    f = OPTFunctions.GridSearch(objective_function=_distance_from_one,
+                                search_space=[SampleIterator(axis) for axis in axes])
+    f.reset_grid()
+    grid = list(itertools.product(*axes))
+
+    # Blocks of samples are the same tuples as samples accessed one at a time
+    for start, stop in [(0, len(grid)), (0, 5), (5, 17), (len(grid) - 1, len(grid))]:
+        samples = f._samples_in(start, stop)
+        assert samples == [f._sample_at(i) for i in range(start, stop)]
+        assert samples == grid[start:stop]
+        assert all(isinstance(sample, tuple) for sample in samples)
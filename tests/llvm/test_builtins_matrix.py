@@ -198,3 +198,16 @@ def test_dot_transposed_llvm_constant_dim(benchmark, mode):
         cuda_res = pycuda.driver.Out(llvm_tvec_res)
         benchmark(binf2.cuda_call, cuda_vec, cuda_mat, cuda_res)
     assert np.allclose(llvm_tvec_res, trans_dot_res)
+
+
+@pytest.mark.llvm
+@pytest.mark.benchmark(group="Outer")
+def test_outer_product_add_llvm(benchmark):
+    llvm_fun = pnlvm.LLVMBinaryFunction.get("__pnl_builtin_outer_product_add")
+
+    # The builtin accumulates into the matrix, so run it exactly once
+    res = np.copy(u)
+    ct_res = res.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+    benchmark.pedantic(llvm_fun, args=(ct_vec, ct_tvec, DIM_X, DIM_Y, ct_res),
+                       rounds=1, iterations=1)
+    assert np.allclose(res, u + np.outer(vector, trans_vector))
@@ -1,4 +1,5 @@
 import ctypes
+import itertools
 import numpy as np
 import pytest
 
@@ -48,3 +49,21 @@ def test_recompile():
 
     binf(ct_vec, ct_mat, x, y, ct_res)
     assert np.array_equal(new_res, callable_res)
+
+
+@pytest.mark.llvm
+def test_cartesian_product_cache():
+    axes = ((0.0, 0.5, 1.0), (1.0, 2.0))
+    product = pnlvm.execution._cartesian_product(axes, np.float64)
+    assert np.array_equal(product, list(itertools.product(*axes)))
+    assert not product.flags.writeable
+
+    # The same samples return the same (cached) array
+    assert pnlvm.execution._cartesian_product(tuple(tuple(axis) for axis in axes), np.float64) is product
+
+    # Changed samples produce a new array, which replaces the cached one
+    new_axes = ((0.0, 0.5, 1.0), (1.0, 3.0))
+    new_product = pnlvm.execution._cartesian_product(new_axes, np.float64)
+    assert new_product is not product
+    assert np.array_equal(new_product, list(itertools.product(*new_axes)))
+    assert pnlvm.execution._cartesian_product.cache_info().currsize == 1
@@ -313,3 +313,12 @@ class TestLCControlMechanism:
         assert m2.parameter_ports[pnl.SLOPE].value == [10]
         assert c2.control_signals[2].value == [10]
         assert m3.parameter_ports[pnl.SLOPE].value == [10]
+
+    @pytest.mark.parametrize('arg_name, arg', [('combine_costs', 'not a function'),
+                                               ('modulation', 3),
+                                               ('default_allocation', 'not a number'),
+                                               ('compute_reconfiguration_cost', 2.0)])
+    def test_control_mechanism_invalid_arg(self, arg_name, arg):
+        with pytest.raises(pnl.ControlMechanismError) as error_text:
+            pnl.ControlMechanism(**{arg_name: arg})
+        assert f"The '{arg_name}' arg of ControlMechanism must be" in str(error_text.value)
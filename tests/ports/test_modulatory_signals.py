@@ -1,10 +1,15 @@
+import numpy as np
+
 from psyneulink.core.compositions.composition import Composition
+from psyneulink.core.components.functions.optimizationfunctions import GridSearch, MAXIMIZE
 from psyneulink.core.components.functions.transferfunctions import Exponential
 from psyneulink.core.components.mechanisms.processing.transfermechanism import TransferMechanism
 from psyneulink.core.components.mechanisms.processing.objectivemechanism import ObjectiveMechanism
 from psyneulink.core.components.mechanisms.modulatory.control.controlmechanism import ControlMechanism
 from psyneulink.core.components.mechanisms.modulatory.control.gating.gatingmechanism import GatingMechanism
-from psyneulink.core.components.ports.modulatorysignals.controlsignal import ControlSignal
+from psyneulink.core.components.mechanisms.modulatory.control.optimizationcontrolmechanism import \
+    OptimizationControlMechanism
+from psyneulink.core.components.ports.modulatorysignals.controlsignal import ControlSignal, CostFunctions
 from psyneulink.core.components.ports.modulatorysignals.gatingsignal import GatingSignal
 
 from psyneulink.core.globals.keywords import SLOPE, RESULT
@@ -19,6 +24,51 @@ class TestControlSignals:
         ctl_mech.execute()
         assert True
 
+    def test_control_signal_intensity_costs(self):
+        mech = TransferMechanism()
+        ctl_sig = ControlSignal(modulates=(SLOPE, mech), cost_options=CostFunctions.INTENSITY)
+        ctl_mech = ControlMechanism(control_signals=[ctl_sig])
+        context = ctl_mech.most_recent_context
+
+        for intensity in [2.0, 3.0, 2.0]:
+            assert np.allclose(ctl_sig.compute_costs([intensity], context), np.exp(intensity))
+            assert np.allclose(ctl_sig.parameters.intensity_cost._get(context), np.exp(intensity))
+            assert np.allclose(ctl_sig.intensity_cost_function.parameters.variable._get(context), intensity)
+            assert np.allclose(ctl_sig.intensity_cost_function.parameters.value._get(context), np.exp(intensity))
+
+        # Modulation of the params of the intensity_cost_function changes its costs
+        ctl_sig.function.parameters.intensity_cost_fct_mult_param._set(3, context)
+        assert np.allclose(ctl_sig.compute_costs([2.0], context), np.exp(6))
+        ctl_sig.intensity_cost_function.parameters.scale._set(2, context)
+        assert np.allclose(ctl_sig.compute_costs([2.0], context), 2 * np.exp(6))
+
+    def test_control_signal_intensity_costs_in_search(self):
+        mech = TransferMechanism()
+        ctl_sig = ControlSignal(modulates=(SLOPE, mech),
+                                allocation_samples=[1, 2, 3],
+                                cost_options=CostFunctions.INTENSITY)
+        comp = Composition()
+        comp.add_node(mech)
+        comp.add_controller(OptimizationControlMechanism(agent_rep=comp,
+                                                         features=[mech.input_port],
+                                                         objective_mechanism=ObjectiveMechanism(monitor=mech),
+                                                         function=GridSearch(direction=MAXIMIZE, save_values=True),
+                                                         control_signals=[ctl_sig]))
+
+        # The net outcome of each allocation is its outcome (the allocation, for an input of 1) less its intensity cost;
+        #    the allocation chosen is 1
+        comp.run(inputs={mech: [1]})
+        saved_values = comp.controller.function.parameters.saved_values.get(comp)
+        assert np.allclose(np.ravel(saved_values), [a - np.exp(a) for a in [1, 2, 3]])
+        assert np.allclose(ctl_sig.parameters.intensity_cost.get(comp), np.exp(1))
+
+        # Modulation of the params of the intensity_cost_function changes the costs used in the search
+        ctl_sig.intensity_cost_function.parameters.scale.set(2, comp)
+        comp.run(inputs={mech: [1]})
+        saved_values = comp.controller.function.parameters.saved_values.get(comp)
+        assert np.allclose(np.ravel(saved_values), [a - 2 * np.exp(a) for a in [1, 2, 3]])
+        assert np.allclose(ctl_sig.parameters.intensity_cost.get(comp), 2 * np.exp(1))
+
     def test_alias_equivalence_for_modulates_and_projections(self):
         inputs = [1, 9, 4, 3, 2]
         comp1 = Composition()